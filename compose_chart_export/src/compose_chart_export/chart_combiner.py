@@ -17,12 +17,13 @@ logger = logging.getLogger(__name__)
 def combine_values_yaml(old: Path, new: Path) -> str:
     parsed_old: dict = cast(dict, parse_payload(old))
     parsed_new: dict = cast(dict, parse_payload(new))
-    chart_name = read_chart_name(new.parent)
+    chart_name = ""  # Chart.yaml is only parsed once there is an override to log
     old_value: Any
     for nested_key, old_value in iter_nested_key_values(parsed_old):
         new_value = read_nested_or_none(parsed_new, nested_key)
         if isinstance(old_value, dict) or new_value == old_value:
             continue
+        chart_name = chart_name or read_chart_name(new.parent)
         logger.warning(
             f"chart={chart_name} using old value for {nested_key}={old_value} instead of {new_value}"
         )
@@ -49,14 +50,15 @@ def combine(old_path: Path, new_path: Path) -> None:
     }
     for rel_path, path in new_rel_paths.items():
         if existing := old_rel_paths.get(rel_path):
-            existing_lines = existing.read_text().splitlines()
             if rel_path == "values.yaml":
                 new_content = combine_values_yaml(existing, path)
                 path.write_text(new_content)
                 continue
+            existing_text = existing.read_text()
+            existing_lines = existing_text.splitlines()
             if existing_lines and existing_lines[0] == "# FROZEN":
                 logger.warning(f"keeping as is: {rel_path}")
-                path.write_text(existing.read_text())
+                path.write_text(existing_text)
                 continue
             all_lines = ensure_no_update_lines_kept(
                 existing_lines, path.read_text().splitlines(), rel_path
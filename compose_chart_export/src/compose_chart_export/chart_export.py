@@ -1,7 +1,7 @@
 import logging
 import os
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
 
 from compose_chart_export.chart_file_templates import (
     ChartTemplateSpec,
@@ -16,7 +16,7 @@ from compose_chart_export.chart_file_templates import (
     service_yaml,
     values_yaml,
 )
-from zero_3rdparty.file_utils import clean_dir, ensure_parents_write_text
+from zero_3rdparty.file_utils import clean_dir
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +49,17 @@ def _export_chart(
     if chart_path.is_dir() and os.listdir(chart_path):
         clean_dir(chart_path)
     skip_generators = skip_generators or []
+    created_dirs: Set[Path] = set()
     for rel_path, content_generator in PATH_TO_GENERATORS.items():
         if rel_path in skip_generators:
             continue
         dest = chart_path / rel_path
         if content := content_generator(spec):
-            ensure_parents_write_text(dest, content)
+            # only two distinct parents (chart root and templates/)
+            if (parent := dest.parent) not in created_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(parent)
+            dest.write_text(content)
     return chart_path
 
 
@@ -29,6 +29,10 @@ class PortProtocol(StrEnumNoRepr):
     udp = "udp"
 
 
+# str members hash and compare like their values, plain strings match as well
+_PROTOCOL_VALUES: frozenset[str] = frozenset(PortProtocol)
+
+
 @dataclass(frozen=True)
 class PrefixPort:
     """Used for creating virtual services with ports that maps to paths.
@@ -50,6 +54,9 @@ class PrefixPort:
         >>> prefix_port3 = PrefixPort(prefix="/", port=8000, protocol=PortProtocol.http)
         >>> prefix_port3.as_kub_port_name(prefix_port3)
         'http-8000'
+        >>> PrefixPort(prefix="/", port=21, protocol="ftp")
+        Traceback (most recent call last):
+        AssertionError: unknown protocol: ftp, ...
 
 
     Args:
@@ -65,10 +72,9 @@ class PrefixPort:
     KUB_PORT_MAX_LEN: ClassVar[int] = 15
 
     def __post_init__(self):
-        options = list(PortProtocol)
         assert (
-            self.protocol in options
-        ), f"unknown protocol: {self.protocol}, possibilities: {options}"
+            self.protocol in _PROTOCOL_VALUES
+        ), f"unknown protocol: {self.protocol}, possibilities: {list(PortProtocol)}"
 
     @classmethod
     def as_kub_port_name(cls, value: PrefixPort):
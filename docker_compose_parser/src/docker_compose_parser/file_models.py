@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from copy import deepcopy
 from dataclasses import dataclass
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
 
@@ -44,6 +44,11 @@ def _find_test(healthcheck: dict) -> Optional[str]:
     return cmd
 
 
+@lru_cache(maxsize=16)
+def _valid_field_names(model_type: type[Entity]) -> frozenset[str]:
+    return frozenset(field_names(model_type))
+
+
 class ComposeHealthCheck(Entity):
     test: Union[str, list[str]]
     interval: str = "30s"
@@ -99,7 +104,7 @@ class ComposeHealthCheck(Entity):
         raw.pop(
             "start_interval", None
         )  # https://github.com/docker/compose/issues/10830
-        valid_names = set(field_names(cls))
+        valid_names = _valid_field_names(cls)
         return cls(**{k: v for k, v in raw.items() if k in valid_names})
 
 
@@ -223,13 +228,15 @@ def iter_compose_info(
 @total_ordering
 @dataclass
 class _NameDict:
+    __slots__ = ("name", "service_dict", "index")  # slots=True requires py310
+
     name: str
     service_dict: dict
     index: int
 
     def depends_on(self, name: str) -> bool:
-        depends_on = self.service_dict.get("depends_on", [])
-        return name in list(depends_on)
+        # list or long-syntax dict, both support `in` without copying
+        return name in self.service_dict.get("depends_on", ())
 
     def __lt__(self, other):
         if not isinstance(other, _NameDict):
@@ -251,13 +258,16 @@ def iter_sorted_services(compose_payload: str | Path) -> list[tuple[str, dict]]:
 
 def read_compose_info(compose_path: Path, service_name: str) -> ComposeServiceInfo:
     parsed = parse_payload(compose_path, FileFormat.yaml)
-    image = read_nested_or_none(parsed, f"services.{service_name}.image")
-    labels = read_nested_or_none(parsed, f"services.{service_name}.labels") or {}
-    env = read_nested_or_none(parsed, f"services.{service_name}.environment") or {}
-    ports = read_nested_or_none(parsed, f"services.{service_name}.ports") or []
-    command = read_nested_or_none(parsed, f"services.{service_name}.command") or []
-    volumes = read_nested_or_none(parsed, f"services.{service_name}.volumes") or []
-    healthcheck = read_nested_or_none(parsed, f"services.{service_name}.healthcheck")
+    service = read_nested_or_none(parsed, f"services.{service_name}")
+    if not isinstance(service, dict):
+        service = {}
+    image = service.get("image")
+    labels = service.get("labels") or {}
+    env = service.get("environment") or {}
+    ports = service.get("ports") or []
+    command = service.get("command") or []
+    volumes = service.get("volumes") or []
+    healthcheck = service.get("healthcheck")
     return ComposeServiceInfo(
         image=image,  # type: ignore
         labels=labels,  # type: ignore
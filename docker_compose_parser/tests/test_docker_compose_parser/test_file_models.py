@@ -1,6 +1,11 @@
 from pathlib import Path
 
-from docker_compose_parser.file_models import ComposeHealthCheck, iter_compose_info
+from docker_compose_parser.file_models import (
+    ComposeHealthCheck,
+    iter_compose_info,
+    iter_sorted_services,
+    read_compose_info,
+)
 
 
 def test_parse_es_file():
@@ -38,3 +43,69 @@ def test_parse_healthcheck_from_port_path():
         start_interval="5s",
         retries=2,
     )
+
+
+def test_iter_sorted_services(tmp_path):
+    path = tmp_path / "docker-compose.yaml"
+    path.write_text(
+        """\
+services:
+  app:
+    image: app
+    depends_on:
+      - db
+  db:
+    image: db
+  other:
+    image: other
+"""
+    )
+    assert [name for name, _ in iter_sorted_services(path)] == ["db", "app", "other"]
+
+
+def test_iter_sorted_services_long_syntax_depends_on(tmp_path):
+    path = tmp_path / "docker-compose.yaml"
+    path.write_text(
+        """\
+services:
+  app:
+    image: app
+    depends_on:
+      db:
+        condition: service_healthy
+  db:
+    image: db
+"""
+    )
+    assert [name for name, _ in iter_sorted_services(path)] == ["db", "app"]
+
+
+def test_read_compose_info(tmp_path):
+    path = tmp_path / "docker-compose.yaml"
+    path.write_text(
+        """\
+services:
+  app:
+    image: app:latest
+    environment:
+      KEY: value
+    ports:
+      - "8000:8000"
+"""
+    )
+    info = read_compose_info(path, "app")
+    assert info.image == "app:latest"
+    assert info.default_env == {"KEY": "value"}
+    assert info.default_ports == ["8000:8000"]
+    assert info.labels == {}
+    assert info.healthcheck is None
+    assert read_compose_info(path, "missing").image is None
+
+
+def test_parse_healthcheck_drops_unknown_keys():
+    healthcheck = ComposeHealthCheck.parse_healthcheck(
+        {"port": 8000, "path": "/health", "start-period": "10s"}
+    )
+    assert healthcheck is not None
+    assert healthcheck.test == "curl -f http://localhost:8000/health || exit 1"
+    assert healthcheck.start_period == "10s"
@@ -154,6 +154,9 @@ def copy_and_validate(model: BaseModelT, **updates) -> BaseModelT:
     if IS_PYDANTIC_V2:
         return model.model_copy(update=updates, deep=True)
     new_model = model.copy(update=updates, deep=True)
+    if not updates:
+        # model is already validated, only the updates need a validation round
+        return new_model
     return cls(**new_model.dict())
 
 
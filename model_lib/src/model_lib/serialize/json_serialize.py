@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from contextlib import suppress
+from json import JSONEncoder
 from typing import Any, Callable, Optional, TypeVar
 
 from typing_extensions import TypeAlias
@@ -20,18 +21,17 @@ def orjson_dumps_parse() -> dump_parse:
     with suppress(ModuleNotFoundError):
         import orjson
 
+        compact_option = orjson.OPT_NON_STR_KEYS
+        pretty_option = compact_option | orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+
         def dump_orjson(instance: T) -> str:
             return orjson.dumps(
-                instance, default=model_dump, option=orjson.OPT_NON_STR_KEYS
+                instance, default=model_dump, option=compact_option
             ).decode("utf-8")
 
         def pretty_dump_orjson(instance: T) -> str:
             return orjson.dumps(
-                instance,
-                default=model_dump,
-                option=orjson.OPT_NON_STR_KEYS
-                | orjson.OPT_SORT_KEYS
-                | orjson.OPT_INDENT_2,
+                instance, default=model_dump, option=pretty_option
             ).decode("utf-8")
 
         return dump_orjson, pretty_dump_orjson, orjson.loads
@@ -47,39 +47,37 @@ def pydantic_dumps_parse() -> dump_parse:
 
         import pydantic
 
+        compact_encoder, pretty_encoder = _stdlib_encoders()
+
         def dump_pydantic(instance: T) -> str:
             if isinstance(instance, pydantic.BaseModel):
                 return model_json(instance)
-            return json.dumps(instance, indent=None, separators=(",", ":"))
+            return compact_encoder.encode(instance)
 
         def pretty_dump_stdlib(instance: T) -> str:
             if isinstance(instance, pydantic.BaseModel):
                 return model_json(instance, indent=2)
-            return json.dumps(
-                instance,
-                indent=2,
-                sort_keys=True,
-                ensure_ascii=False,
-                default=model_dump,
-            )
+            return pretty_encoder.encode(instance)
 
         logger.warning("using pydantic json dumping, orjson is a bit more flexible")
         return dump_pydantic, pretty_dump_stdlib, json.loads
     return None
 
 
-def stdlib_dumps_parse() -> dump_parse:
-    import json
+def _stdlib_encoders() -> tuple[JSONEncoder, JSONEncoder]:
+    """json.dumps creates a new encoder on every call with non-default kwargs."""
+    compact = JSONEncoder(indent=None, separators=(",", ":"))
+    pretty = JSONEncoder(
+        indent=2, sort_keys=True, ensure_ascii=False, default=model_dump
+    )
+    return compact, pretty
 
-    def dump_stdlib(instance: T) -> str:
-        return json.dumps(instance, indent=None, separators=(",", ":"))
 
-    def pretty_dump_stdlib(instance: T) -> str:
-        return json.dumps(
-            instance, indent=2, sort_keys=True, ensure_ascii=False, default=model_dump
-        )
+def stdlib_dumps_parse() -> dump_parse:
+    import json
 
-    return dump_stdlib, pretty_dump_stdlib, json.loads
+    compact_encoder, pretty_encoder = _stdlib_encoders()
+    return compact_encoder.encode, pretty_encoder.encode, json.loads
 
 
 for func in [orjson_dumps_parse, pydantic_dumps_parse, stdlib_dumps_parse]:
@@ -134,6 +134,9 @@ def _parse_str(payload: str, format=FileFormat.json):
 
 @parse_payload.register
 def _parse_bytes(payload: bytes, format=FileFormat.json):
+    if format == FileFormat.json:
+        # both orjson.loads and json.loads accept utf-8 bytes, skip the decode
+        return parse_json(payload)
     return parse_payload(payload.decode("utf-8"), format)
 
 
@@ -146,7 +149,11 @@ def _parse_path(payload: Path, format=FileFormat.json):
             format = file_format.lstrip(".")
     else:
         logger.warning(f"attempting to parse a file {payload.name} as {format}")
-    return parse_payload(payload.read_text(), format)
+    if format == FileFormat.json:
+        return parse_json(payload.read_bytes())
+    # text mode keeps the \r\n -> \n translation yaml/toml values rely on
+    # utf-8 like _parse_bytes, not the locale default
+    return parse_payload(payload.read_text(encoding="utf-8"), format)
 
 
 @parse_payload.register
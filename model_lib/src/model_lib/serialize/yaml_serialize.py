@@ -84,10 +84,10 @@ def dump_yaml_str(
 
 
 def dump_yaml_file(path: PathLike, data: Mapping, width=1000, sort_keys: bool = False):
-    with open(path, "w") as f:
-        yaml.safe_dump(
-            data, stream=f, default_flow_style=False, width=width, sort_keys=sort_keys
-        )
+    # render before opening: one write instead of one per yaml token, and a
+    # failing dump no longer leaves a truncated file behind
+    text = dump_yaml_str(data, width=width, allow_unicode=False, sort_keys=sort_keys)
+    Path(path).write_text(text)
     return path
 
 
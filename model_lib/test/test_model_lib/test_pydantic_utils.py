@@ -1,6 +1,8 @@
 from datetime import timedelta, timezone
+from typing import ClassVar
 
 import pydantic
+import pytest
 from pydantic import BaseModel, Field
 
 from model_lib import Event
@@ -100,6 +102,29 @@ def test_copy_and_validate():
     assert model1.name != model2.name
 
 
+@pytest.mark.skipif(IS_PYDANTIC_V2, reason="v2 uses model_copy, no re-validation")
+def test_copy_and_validate_no_updates_skips_validation():
+    from pydantic import validator
+
+    class _CountedModel(BaseModel):
+        name: str
+        validations: ClassVar[int] = 0
+
+        @validator("name")
+        def count_validation(cls, value):
+            _CountedModel.validations += 1
+            return value
+
+    model1 = _CountedModel(name="m1")
+    assert _CountedModel.validations == 1
+    model2 = copy_and_validate(model1)
+    assert model2 == model1
+    assert model2 is not model1
+    assert _CountedModel.validations == 1
+    copy_and_validate(model1, name="m2")
+    assert _CountedModel.validations == 2
+
+
 def test_cls_defaults():
     assert cls_defaults(_MyModel) == {"default": "my-default"}
 
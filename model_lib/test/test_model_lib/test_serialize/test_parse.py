@@ -1,3 +1,7 @@
+from pathlib import Path
+
+import pytest
+
 from model_lib import Event
 from model_lib.constants import (
     METADATA_DUMP_KEY,
@@ -7,7 +11,7 @@ from model_lib.constants import (
     FileFormat,
 )
 from model_lib.serialize.dump import dump, dump_with_metadata
-from model_lib.serialize.parse import parse_model_metadata
+from model_lib.serialize.parse import parse_model_metadata, parse_payload
 
 
 class _MyModelWithAge(Event):
@@ -60,3 +64,39 @@ def test_parse_directly():
     model_payload = model.dict()
     model_back, _ = parse_model_metadata(model_payload, t=_MyModelWithAge)
     assert model == model_back
+
+
+@pytest.mark.parametrize(
+    "format, content",
+    [
+        (FileFormat.json, '{"name": "ø", "age": 1}'),
+        (FileFormat.yaml, "name: ø\nage: 1\n"),
+    ],
+)
+def test_parse_payload_bytes_and_path(tmp_path, format, content):
+    expected = {"name": "ø", "age": 1}
+    assert parse_payload(content.encode("utf-8"), format) == expected
+    path = tmp_path / f"payload.{format}"
+    path.write_text(content, encoding="utf-8")
+    assert parse_payload(path, format) == expected
+
+
+def test_parse_payload_path_translates_crlf(tmp_path):
+    path = tmp_path / "payload.toml"
+    path.write_bytes(b'a = """\r\nl1\r\nl2"""\r\n')
+    assert parse_payload(path, FileFormat.toml) == {"a": "l1\nl2"}
+
+
+def test_parse_payload_path_reads_text_as_utf8(tmp_path, monkeypatch):
+    path = tmp_path / "payload.yaml"
+    path.write_bytes("name: ø\n".encode("utf-8"))
+    read_text = Path.read_text
+    encodings = []
+
+    def spy_read_text(self, *args, **kwargs):
+        encodings.append(kwargs.get("encoding"))
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", spy_read_text)
+    assert parse_payload(path, FileFormat.yaml) == {"name": "ø"}
+    assert encodings == ["utf-8"]
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 # flake8: noqa
 # otherwise pants will not include the file in the tests
 from model_lib.serialize import *
@@ -29,6 +31,14 @@ def test_edit_index(tmp_path):
     assert read_nested(loaded, "spec.containers.[1].new") == "YES"
 
 
+def test_dump_yaml_file_failure_keeps_existing_content(tmp_path):
+    path = tmp_path / "existing.yaml"
+    path.write_text("old: 1\n")
+    with pytest.raises(yaml_serialize.yaml.representer.RepresenterError):
+        dump_yaml_file(path, {"new": object()})
+    assert path.read_text() == "old: 1\n"
+
+
 DIR = Path(__file__).parent
 
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import threading
+import weakref
 from collections.abc import Iterable
 from contextlib import suppress
 from functools import partial
@@ -28,11 +29,12 @@ def _raise_queue_is_closed(item: object, *, queue: ClosableQueue, **kwargs):
 
 class ClosableQueue(Queue[QueueType], Generic[QueueType]):
     SENTINEL = object()
-    __QUEUES: list[ClosableQueue] = []
+    # weak references, a queue dropped without close() should not be kept alive
+    __QUEUES: weakref.WeakSet[ClosableQueue] = weakref.WeakSet()
 
     def __init__(self, maxsize: int = 0):  # 0 == infinite
         super().__init__(maxsize=maxsize)
-        self.__QUEUES.append(self)
+        self.__QUEUES.add(self)
         # ensure close doesn't block and can set raise error
         self.mutex = RLock()  # type: ignore
 
@@ -44,8 +46,7 @@ class ClosableQueue(Queue[QueueType], Generic[QueueType]):
         with self.mutex:
             self.put(self.SENTINEL)
             self.put = partial(_raise_queue_is_closed, queue=self)
-        with suppress(Exception):
-            self.__QUEUES.remove(self)
+        self.__QUEUES.discard(self)
 
     def close_safely(self):
         with suppress(QueueIsClosed):
@@ -82,6 +83,21 @@ class ClosableQueue(Queue[QueueType], Generic[QueueType]):
         next_or_sentinel = partial(self.pop, self.SENTINEL)
         return iter(next_or_sentinel, self.SENTINEL)
 
+    def drain(self, max_items: int = 0) -> list[QueueType]:  # 0 == all
+        """Non-blocking, takes the queued items with a single lock acquisition.
+
+        Stops at the close sentinel and leaves it queued, like iter_non_blocking."""
+        items: list[QueueType] = []
+        with self.not_empty:
+            queue = self.queue
+            while queue and queue[0] is not self.SENTINEL:
+                items.append(queue.popleft())
+                if len(items) == max_items:
+                    break
+            if items:
+                self.not_full.notify(len(items))
+        return items
+
     @classmethod
     def close_all(cls):
         if cls.__QUEUES:
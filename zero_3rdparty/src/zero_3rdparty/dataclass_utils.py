@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from collections.abc import Container
 from dataclasses import fields
 from typing import Any, Callable, TypeVar
@@ -7,12 +8,25 @@ from typing import Any, Callable, TypeVar
 T = TypeVar("T")
 
 
+# weak keys, a cache entry must not keep a locally defined dataclass alive
+_field_names_cache: weakref.WeakKeyDictionary[
+    type, tuple[str, ...]
+] = weakref.WeakKeyDictionary()
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    if (names := _field_names_cache.get(cls)) is None:
+        names = _field_names_cache[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
 def field_names(cls: type[T] | T) -> list[str]:
-    return [f.name for f in fields(cls)]  # type: ignore
+    """fields() filters the class dict on every call, the names are cached weakly per class."""
+    return list(_field_names(cls if isinstance(cls, type) else type(cls)))
 
 
 def values(instance: T) -> list:
-    return [getattr(instance, name) for name in field_names(instance)]
+    return [getattr(instance, name) for name in _field_names(type(instance))]
 
 
 def copy(
@@ -36,6 +50,6 @@ def key_values(
 ) -> dict[str, Any]:
     return {
         field_name: getattr(instance, field_name)
-        for field_name in field_names(instance)
+        for field_name in _field_names(type(instance))
         if filter is None or filter(field_name)
     }
@@ -15,9 +15,17 @@ ENV_LOG_FORMAT_CONSOLE = "log_format_console"
 
 
 def upper_lower_case(env_key: str) -> Iterable[str]:
+    """
+    >>> list(upper_lower_case("log_level"))
+    ['log_level', 'LOG_LEVEL']
+    >>> list(upper_lower_case("Log_Level"))
+    ['Log_Level', 'log_level', 'LOG_LEVEL']
+    """
     yield env_key
-    yield env_key.lower()
-    yield env_key.upper()
+    if (lower := env_key.lower()) != env_key:
+        yield lower
+    if (upper := env_key.upper()) != env_key:
+        yield upper
 
 
 T = TypeVar("T")
@@ -42,8 +42,8 @@ To define errors subclass the BaseError class and specify:
 from __future__ import annotations
 
 import logging
+import sys
 import traceback
-from asyncio import TimeoutError as AsyncTimeoutError
 from concurrent.futures import TimeoutError as ConcTimeoutError
 from functools import partial, singledispatch
 from types import TracebackType
@@ -136,11 +136,17 @@ def _identity(error: Code):
 
 @as_error_code.register(TimeoutError)
 @as_error_code.register(ConcTimeoutError)
-@as_error_code.register(AsyncTimeoutError)
 def _timeout(error: TimeoutError) -> Code:
     return Code.TIMEOUT  # type: ignore
 
 
+if sys.version_info < (3, 11):
+    # from 3.11 it is an alias of TimeoutError, avoid importing asyncio for nothing
+    from asyncio import TimeoutError as AsyncTimeoutError
+
+    as_error_code.register(AsyncTimeoutError, _timeout)
+
+
 def is_crash(code_or_error: str | BaseException):
     code = as_error_code(code_or_error)
     return code in CRASH_CODES
@@ -182,6 +188,8 @@ class BaseError(Exception):
         return str(self)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return str(self) == str(other)
 
 
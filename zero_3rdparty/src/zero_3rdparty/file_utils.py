@@ -86,20 +86,25 @@ def copy(
     logger.info(f"cp {src} {dest}")
     dest = Path(dest)
     if ensure_parents:
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(dest.parent)
     if Path(src).is_dir():
         if clean_dest and dest.exists():
             clean_dir(dest, recreate=False)
         shutil.copytree(src, dest)
     else:
-        if dest.exists():
-            dest.unlink()
+        dest.unlink(missing_ok=True)
         shutil.copy(src, dest)
 
 
+def _ensure_dir(path: Path) -> None:
+    """mkdir parents unless the directory already exists."""
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+
+
 def ensure_parents_write_text(path: os.PathLike, text: str, log: bool = False) -> None:
     path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(path.parent)
     path.write_text(text)
     if log:
         logger.info(f"writing to {path}, text={text}")
@@ -164,11 +169,12 @@ def update_between_markers(
     append_if_not_found: bool = False,
 ):
     path = Path(path)
-    if not path.exists():
+    try:
+        old_text = path.read_text()
+    except FileNotFoundError:
         ensure_parents_write_text(path, f"{start_marker}\n{content}\n{end_marker}\n")
         return
 
-    old_text = path.read_text()
     if append_if_not_found:
         try:
             old_content = read_between_markers(old_text, start_marker, end_marker)
@@ -179,8 +185,9 @@ def update_between_markers(
             return
     else:
         old_content = read_between_markers(old_text, start_marker, end_marker)
-    content = old_text.replace(old_content, content)
-    path.write_text(content)
+    if old_content == content:
+        return  # skip the write, keeps mtime for tools watching the file
+    path.write_text(old_text.replace(old_content, content))
 
 
 class MarkerNotFoundError(ValueError):
@@ -4,7 +4,7 @@ import inspect
 from collections import ChainMap, defaultdict
 from collections.abc import Generator
 from functools import singledispatch
-from itertools import chain, tee
+from itertools import chain
 from types import ModuleType
 from typing import (
     Any,
@@ -186,9 +186,9 @@ def select_attrs(
             if (attr_value := getattr(instance, attr_name, None))
         }
     return {
-        attr_name: getattr(instance, attr_name)
+        attr_name: attr_value
         for attr_name in attrs
-        if getattr(instance, attr_name, _missing) is not _missing
+        if (attr_value := getattr(instance, attr_name, _missing)) is not _missing
     }
 
 
@@ -265,9 +265,11 @@ def partition(
     if pred is None:
         pred = bool
 
-    evaluations = ((pred(x), x) for x in iterable)
-    t1, t2 = tee(evaluations)
-    return [x for (cond, x) in t1 if not cond], [x for (cond, x) in t2 if cond]
+    false_items: List[T] = []
+    true_items: List[T] = []
+    for item in iterable:
+        (true_items if pred(item) else false_items).append(item)
+    return false_items, true_items
 
 
 def last(iterable: Iterable[T]) -> Optional[T]:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from logging import config
 
 from zero_3rdparty.env_reader import log_format_console, log_max_msg_length
 from zero_3rdparty.run_env import running_in_container_environment
@@ -69,6 +68,9 @@ def default_handler() -> dict:
 def setup_logging(
     handler_dict: dict | None = None, disable_stream_handler: bool = False
 ):
+    # logging.config pulls in logging.handlers and socketserver, only needed here
+    from logging import config
+
     handlers = {} if disable_stream_handler else {"stream": default_handler()}
     if handler_dict:
         handlers["default"] = handler_dict
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import logging
 import sys
+import weakref
 from collections.abc import Awaitable as ColAwaitable
 from collections.abc import Iterable
 from functools import lru_cache, partial
-from inspect import Parameter, currentframe, isclass, signature
+from inspect import Parameter, currentframe, isclass, isfunction, signature
 from pathlib import Path
 from types import FrameType
 from typing import Callable, TypeVar, cast, get_type_hints
@@ -29,10 +30,8 @@ def _name(obj: type[object] | object) -> str:
 
 
 def short_name(obj: type[object] | object) -> str:
-    _name = as_name(obj)
-    if "." in _name:
-        return _name.rsplit(".", maxsplit=1)[1]
-    return _name
+    # rpartition returns the full name when there is no "."
+    return as_name(obj).rpartition(".")[2]
 
 
 def as_name(obj: type[object] | object) -> str:
@@ -86,9 +85,9 @@ def _detect_main_name() -> str:  # pragma: no cover
         return ".".join(seen + [path.stem])
 
 
-def func_arg_names(
-    func: Callable, skip_self: bool = True, skip_kwargs: bool = True
-) -> list[str]:
+def _func_arg_names(
+    func: Callable, skip_self: bool, skip_kwargs: bool
+) -> tuple[str, ...]:
     def filter(param: Parameter) -> bool:
         if skip_self and param.name == "self":
             return False
@@ -96,9 +95,31 @@ def func_arg_names(
             return False
         return True
 
-    return [
+    return tuple(
         param.name for param in signature(func).parameters.values() if filter(param)
-    ]
+    )
+
+
+# weak keys on the plain function, a cache entry must not keep closures or the
+# `self` of a bound method alive
+_arg_names_cache: weakref.WeakKeyDictionary[
+    Callable, dict[tuple[bool, bool, bool], tuple[str, ...]]
+] = weakref.WeakKeyDictionary()
+
+
+def func_arg_names(
+    func: Callable, skip_self: bool = True, skip_kwargs: bool = True
+) -> list[str]:
+    """inspect.signature is slow, the names are cached for plain functions."""
+    underlying = getattr(func, "__func__", func)
+    if not isfunction(underlying):
+        return list(_func_arg_names(func, skip_self, skip_kwargs))
+    # a bound method's signature drops the first parameter
+    key = (underlying is not func, skip_self, skip_kwargs)
+    cached = _arg_names_cache.setdefault(underlying, {})
+    if (names := cached.get(key)) is None:
+        names = cached[key] = _func_arg_names(func, skip_self, skip_kwargs)
+    return list(names)
 
 
 def func_arg_types(func: Callable) -> list[type]:
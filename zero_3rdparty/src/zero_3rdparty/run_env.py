@@ -2,9 +2,7 @@ import logging
 import os
 import subprocess
 import sys
-import tempfile
 from functools import lru_cache
-from io import TextIOWrapper
 from os import getenv
 from pathlib import Path
 from typing import Callable, TypeVar
@@ -16,15 +14,14 @@ logger = logging.getLogger(__name__)
 def running_in_container_environment() -> bool:
     if os.path.isfile("/.dockerenv"):
         return True
-    with tempfile.NamedTemporaryFile() as tmp:
-        stderr = TextIOWrapper(tmp)
-        try:
-            output = subprocess.check_output(
-                ["ps -eZ --no-headers | grep containerd"], shell=True, stderr=stderr
-            )
-            return bool(output)
-        except subprocess.CalledProcessError:
-            return False
+    try:
+        # look for containerd in the process security contexts
+        output = subprocess.check_output(
+            ["ps", "-eZ", "--no-headers"], stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return b"containerd" in output
 
 
 @lru_cache(maxsize=1)
@@ -32,8 +29,10 @@ def running_in_pants():
     return bool(getenv("RUNNING_IN_PANTS"))
 
 
+@lru_cache(maxsize=1)
 def running_on_host():
-    return not any([running_in_container_environment(), running_in_pants()])
+    # check the env var 1st, the container check might spawn a process
+    return not (running_in_pants() or running_in_container_environment())
 
 
 T = TypeVar("T")
@@ -48,6 +47,10 @@ def on_host_in_container(on_host_value: T, in_container_value: T) -> Callable[[]
     return inner
 
 
-@lru_cache(maxsize=1)
+# assumes sys.argv[0] is not changed after import, pytest.main() callers that
+# swap argv later are not detected
+_IN_TEST_ENV = "pytest" in Path(sys.argv[0]).name
+
+
 def in_test_env() -> bool:
-    return "pytest" in Path(sys.argv[0]).name
+    return _IN_TEST_ENV
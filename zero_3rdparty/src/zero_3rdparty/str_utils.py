@@ -42,11 +42,9 @@ def words_to_list(
         if alternative_split_char is None
         else s.replace(alternative_split_char, split_char)
     )
-    return [
-        part if skip_strip else part.strip()
-        for part in s.split(split_char)
-        if skip_strip or part.strip()
-    ]
+    if skip_strip:
+        return s.split(split_char)
+    return [stripped for part in s.split(split_char) if (stripped := part.strip())]
 
 
 def words_to_set(s: str, split_char: str = " ") -> Set[str]:
@@ -93,15 +91,18 @@ def _want_bool_none(s: None) -> bool:
     return False
 
 
+_TITLE_SEPARATORS = str.maketrans("_-", "  ")
+
+
 def filename_to_title(filename: str) -> str:
     """
     >>> filename_to_title('/Users/espen/source/writings/software/04_writing_docs.md')
     'Writing Docs'
+    >>> filename_to_title('my-first_post.md')
+    'My First Post'
     """
     filename, _ = os.path.splitext(os.path.basename(filename))
-    words_in_filename = re.findall(
-        r"[\w]+", filename.replace("_", " ").replace("-", " ")
-    )
+    words_in_filename = re.findall(r"[\w]+", filename.translate(_TITLE_SEPARATORS))
     return " ".join(
         word.capitalize() for word in words_in_filename if re.search(r"[a-z]", word)
     )
@@ -172,7 +173,15 @@ ansi_escape = re.compile(
 
 def remove_ansi_formatting(raw: str) -> str:
     """https://stackoverflow.com/questions/14693701/how-can-i-remove-the-ansi-
-    escape-sequences-from-a-string-in-python."""
+    escape-sequences-from-a-string-in-python.
+
+    >>> remove_ansi_formatting("\\x1b[1;31mred\\x1b[0m text")
+    'red text'
+    >>> remove_ansi_formatting("plain text")
+    'plain text'
+    """
+    if "\x1b" not in raw:
+        return raw
     return ansi_escape.sub("", raw)
 
 
@@ -224,7 +233,11 @@ def skip_lines(lines: str, skip_parts: List[str]) -> str:
     """
     >>> skip_lines("line1\\nout2\\nline2", ["out"])
     'line1\\nline2'
+    >>> skip_lines("line1\\nline2\\n", ["out"])
+    'line1\\nline2\\n'
     """
+    if not any(skip_part in lines for skip_part in skip_parts):
+        return lines
     return "".join(
         line
         for line in lines.splitlines(keepends=True)
@@ -1,5 +1,7 @@
+import gc
 import logging
 import time
+import weakref
 from concurrent.futures import ThreadPoolExecutor, wait
 
 import pytest
@@ -92,3 +94,39 @@ def test_many_consumers_all_should_finish():
         wait(futures.keys(), timeout=1)
     winner_i = {i for f, i in futures.items() if f.result()}
     assert len(winner_i) == 1
+
+
+def test_unclosed_queue_is_not_kept_alive():
+    queue_ref = weakref.ref(ClosableQueue())
+    gc.collect()
+    assert queue_ref() is None
+
+
+def test_close_all_closes_open_queues():
+    queue = ClosableQueue()
+    ClosableQueue.close_all()
+    with pytest.raises(QueueIsClosed):
+        queue.put(1)
+
+
+def test_drain_takes_batches_and_stops_at_sentinel():
+    queue = ClosableQueue()
+    for i in range(5):
+        queue.put(i)
+    assert queue.drain(max_items=2) == [0, 1]
+    queue.close()
+    assert queue.drain() == [2, 3, 4]
+    assert queue.drain() == []
+    assert list(queue) == []
+
+
+def test_drain_unblocks_bounded_producers():
+    queue = ClosableQueue(maxsize=2)
+    queue.put(1)
+    queue.put(2)
+    with ThreadPoolExecutor() as executor:
+        f = executor.submit(queue.put, 3)
+        time.sleep(0.05)
+        assert queue.drain() == [1, 2]
+        f.result(timeout=1)
+    assert queue.drain() == [3]
@@ -1,5 +1,9 @@
+import gc
+import weakref
 from dataclasses import dataclass
 
+import pytest
+
 from zero_3rdparty.dataclass_utils import copy, field_names, key_values, values
 
 
@@ -16,6 +20,28 @@ def test_field_names():
     assert field_names(MyTestClass) == ["name", "age", "fictive"]
 
 
+def test_field_names_cached_copy_is_safe_to_mutate():
+    field_names(MyTestClass).append("extra")
+    assert field_names(MyTestClass) == ["name", "age", "fictive"]
+
+
+def test_field_names_does_not_keep_class_alive():
+    @dataclass
+    class Local:
+        name: str
+
+    assert field_names(Local) == ["name"]
+    cls_ref = weakref.ref(Local)
+    del Local
+    gc.collect()
+    assert cls_ref() is None
+
+
+def test_field_names_not_a_dataclass():
+    with pytest.raises(TypeError):
+        field_names(object)
+
+
 def test_values():
     instance = MyTestClass(name="espen", age=99)
     assert values(instance) == ["espen", 99, True]
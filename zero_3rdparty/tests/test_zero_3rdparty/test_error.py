@@ -1,4 +1,8 @@
+import asyncio
 import logging
+from concurrent.futures import TimeoutError as ConcTimeoutError
+
+import pytest
 
 from zero_3rdparty.error import (
     BaseError,
@@ -46,3 +50,26 @@ def test_base_error():
     error.code = Code.INVALID_ARGUMENT
     assert is_error(error)
     assert is_error(Code.INVALID_ARGUMENT)
+
+
+def test_base_error_eq():
+    class CountingError(MyBaseError):
+        str_calls = 0
+
+        def __str__(self):
+            CountingError.str_calls += 1
+            return super().__str__()
+
+    error = CountingError("a")
+    assert error == error
+    assert CountingError.str_calls == 0
+    assert error == CountingError("a")
+    assert error != CountingError("b")
+    assert CountingError.str_calls == 4
+
+
+@pytest.mark.parametrize(
+    "error", [TimeoutError(), ConcTimeoutError(), asyncio.TimeoutError()]
+)
+def test_timeout_errors(error):
+    assert is_timeout(error)
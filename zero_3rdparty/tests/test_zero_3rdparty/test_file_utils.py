@@ -27,6 +27,26 @@ def test_file_modified_time(tmp_path):
     assert now < modified_time
 
 
+def test_ensure_parents_write_text(tmp_path):
+    nested = tmp_path / "a/b/c.txt"
+    ensure_parents_write_text(nested, "first")
+    sibling = tmp_path / "a/b/d.txt"
+    ensure_parents_write_text(sibling, "second")
+    assert nested.read_text() == "first"
+    assert sibling.read_text() == "second"
+
+
+def test_copy_file_to_new_and_existing_dest(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("content")
+    dest = tmp_path / "out/dest.txt"
+    copy(src, dest)
+    assert dest.read_text() == "content"
+    src.write_text("updated")
+    copy(src, dest)
+    assert dest.read_text() == "updated"
+
+
 def test_iter_paths(tmp_path):
     filenames = ["1.yaml", "2.yml", "3.ini", "4.txt", "5.ini"]
     for name in filenames:
@@ -144,7 +164,9 @@ def test_update_between_markers(tmp_path, subtests):
             end_marker,
         ]
     with subtests.test("leave file unchanged"):
+        mtime_before = path.stat().st_mtime_ns
         update_between_markers(path, "4th content", start_marker, end_marker)
+        assert path.stat().st_mtime_ns == mtime_before
         assert read_lines() == [
             "original text",
             "",
@@ -1,6 +1,8 @@
 from zero_3rdparty.iter_utils import (
     iter_slices,
+    partition,
     public_values,
+    select_attrs,
     unique_instance_iter,
     want_list,
 )
@@ -67,3 +69,31 @@ def test_iter_slices():
     for slice in iter_slices(full_list, max=3):
         slices.append(slice)
     assert slices == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+
+
+def test_select_attrs():
+    class WithAttrs:
+        a = 1
+        b = None
+        c = 0
+
+    instance = WithAttrs()
+    assert select_attrs(instance, ["a", "b", "c", "missing"]) == {"a": 1}
+    assert select_attrs(instance, ["a", "b", "c", "missing"], skip_none=False) == {
+        "a": 1,
+        "b": None,
+        "c": 0,
+    }
+
+
+def test_partition_calls_pred_once_per_item():
+    calls: list[int] = []
+
+    def is_odd(x: int) -> bool:
+        calls.append(x)
+        return x % 2 != 0
+
+    evens, odds = partition((i for i in range(5)), is_odd)
+    assert evens == [0, 2, 4]
+    assert odds == [1, 3]
+    assert calls == [0, 1, 2, 3, 4]
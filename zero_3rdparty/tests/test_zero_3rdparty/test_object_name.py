@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 from zero_3rdparty.object_name import (
     as_caller_name,
     as_name,
@@ -20,6 +23,11 @@ def test_name_on_instance():
     assert "test_zero_3rdparty.test_object_name.MyClass" == as_name(MyClass())
 
 
+def test_short_name_on_class_and_instance():
+    assert short_name(MyClass) == "MyClass"
+    assert short_name(MyClass()) == "MyClass"
+
+
 def func():
     pass
 
@@ -62,6 +70,58 @@ def test_func_arg_names_from_mixed_func():
     assert func_arg_names(my_function_mixed_hints) == ["a", "b", "c"]
 
 
+def test_func_arg_names_is_cached_and_safe_to_mutate():
+    def my_function(a, b, **kwargs):
+        return b
+
+    names = func_arg_names(my_function)
+    names.append("mutated")
+    assert func_arg_names(my_function) == ["a", "b"]
+    assert func_arg_names(my_function, skip_kwargs=False) == ["a", "b", "kwargs"]
+
+
+def test_func_arg_names_unhashable_callable():
+    class UnhashableCallable:
+        __hash__ = None  # type: ignore
+
+        def __call__(self, a, b):
+            return b
+
+    assert func_arg_names(UnhashableCallable()) == ["a", "b"]
+
+
+def test_func_arg_names_bound_method_does_not_keep_instance_alive():
+    class WithMethod:
+        def method(self, a, b):
+            return b
+
+    instance = WithMethod()
+    assert func_arg_names(instance.method) == ["a", "b"]
+    assert func_arg_names(WithMethod.method) == ["a", "b"]
+    assert func_arg_names(WithMethod.method, skip_self=False) == ["self", "a", "b"]
+    instance_ref = weakref.ref(instance)
+    del instance
+    gc.collect()
+    assert instance_ref() is None
+
+
+def test_func_arg_names_closure_is_not_kept_alive():
+    def make_closure():
+        captured = bytearray(10)
+
+        def closure(a):
+            return captured
+
+        return closure
+
+    closure = make_closure()
+    assert func_arg_names(closure) == ["a"]
+    closure_ref = weakref.ref(closure)
+    del closure
+    gc.collect()
+    assert closure_ref() is None
+
+
 def test_func_arg_types():
     def my_func(a: float, b: str):
         pass
@@ -1,6 +1,11 @@
 import pytest
 
-from zero_3rdparty.str_utils import NoMatchError, group_dict_or_match_error, want_bool
+from zero_3rdparty.str_utils import (
+    NoMatchError,
+    group_dict_or_match_error,
+    remove_ansi_formatting,
+    want_bool,
+)
 
 log_pattern = r"\[(?P<ts>\S+)" r"\s+" r"(?P<log_level>\w+)" r"\]\s?" r"(?P<message>.*)"
 
@@ -31,3 +36,17 @@ def test_want_bool_true(valid_true_bool):
 @pytest.mark.parametrize("valid_false_bool", ["f ", "false", "no", "", None])
 def test_want_bool_false(valid_false_bool):
     assert want_bool(valid_false_bool) is False
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("\x1b[32mok\x1b[0m", "ok"),
+        ("\x1b[?25lhidden cursor\x1b[?25h", "hidden cursor"),
+        ("\x1b[1;31merror:\x1b[0m failed\nnext line", "error: failed\nnext line"),
+        ("no escapes\n", "no escapes\n"),
+        ("", ""),
+    ],
+)
+def test_remove_ansi_formatting(raw, expected):
+    assert remove_ansi_formatting(raw) == expected